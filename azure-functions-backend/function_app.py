@@ -2,7 +2,14 @@ import azure.functions as func
 import logging
 import json
 import os
+import re
+import sqlite3
+import tempfile
+import threading
+import calendar
+import struct
 import requests
+import numpy as np
 from datetime import datetime, timedelta, timezone
 import yfinance as yf
 from openai import AzureOpenAI
@@ -20,6 +27,38 @@ app = func.FunctionApp()
 
 # Initialize dependencies lazily
 _openai = None
+_news_db = None
+_news_db_lock = threading.Lock()
+
+# News cache settings
+NEWS_WINDOW_DAYS = 14
+NEWS_CACHE_PATH = os.environ.get('NEWS_CACHE_PATH', os.path.join(tempfile.gettempdir(), 'news_cache.sqlite3'))
+DEFAULT_NEWS_CACHE_TTL_SECONDS = 900
+NEWS_PAGE_SIZE = 100
+NEWS_MAX_PAGES = 5
+NEWS_REQUEST_TIMEOUT_SECONDS = 10
+NEWS_RETRY_SECONDS = 120
+_PUBLISHED_AT_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})')
+
+# History serialization settings
+HISTORY_CHUNK_ROWS = 500
+FLOAT32_PRICE_LIMIT = 65536.0
+HISTORY_JSON_ROW_TEMPLATE = '{"date": "%s", "open": %.2f, "high": %.2f, "low": %.2f, "close": %.2f, "volume": %d}'
+HISTORY_ROW_TEMPLATES = {
+    'json': (HISTORY_JSON_ROW_TEMPLATE, ', '),
+    'ndjson': (HISTORY_JSON_ROW_TEMPLATE, '\n'),
+    'csv': ('%s,%.2f,%.2f,%.2f,%.2f,%d', '\n')
+}
+HISTORY_MIMETYPES = {
+    'json': 'application/json',
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+    'packed': 'application/octet-stream'
+}
+HISTORY_PACKED_HEADER = struct.Struct('<4sIII')
+HISTORY_PACKED_MAGIC = b'STKH'
+HISTORY_PACKED_VERSION = 2
+HISTORY_PACKED_FLAG_FLOAT64 = 0x1
 
 def get_openai() -> AzureOpenAI:
     """
@@ -53,6 +92,277 @@ def get_newsapi():
         'base_url': 'https://newsapi.org/v2'
     }
 
+class NewsAPIError(Exception):
+    """Raised when NewsAPI returns an error response"""
+
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+def get_news_cache_ttl() -> int:
+    """
+    Read the news cache TTL from the environment
+    
+    Falls back to DEFAULT_NEWS_CACHE_TTL_SECONDS when the variable is
+    missing or invalid, so a bad value can't break the other endpoints.
+    
+    Returns:
+        int: Seconds a symbol's cached news stays fresh
+    """
+    value = os.environ.get('NEWS_CACHE_TTL_SECONDS')
+    if value is None:
+        return DEFAULT_NEWS_CACHE_TTL_SECONDS
+    try:
+        return int(value)
+    except ValueError:
+        logger.error(f"Invalid NEWS_CACHE_TTL_SECONDS value: {value}")
+        return DEFAULT_NEWS_CACHE_TTL_SECONDS
+
+def fetch_news_articles(query: str, from_param: str, to_param: str) -> list:
+    """
+    Fetch every NewsAPI article for a query within a time range
+    
+    Results are requested newest first and paged until NewsAPI has no
+    more, so nothing between from_param and to_param is skipped. Paging
+    stops early after NEWS_MAX_PAGES, or if a later page fails (including
+    the plan's result limit), keeping the pages already fetched.
+    
+    Args:
+        query (str): NewsAPI search expression
+        from_param (str): Oldest publish time, ISO 8601
+        to_param (str): Newest publish time, ISO 8601
+    
+    Returns:
+        list: Raw article objects from NewsAPI
+    
+    Raises:
+        NewsAPIError: If the first page fails or NewsAPI can't be reached
+    """
+    newsapi = get_newsapi()
+    url = f"{newsapi['base_url']}/everything"
+    articles = []
+    for page in range(1, NEWS_MAX_PAGES + 1):
+        params = {
+            'q': query,
+            'language': 'en',
+            'sortBy': 'publishedAt',
+            'pageSize': NEWS_PAGE_SIZE,
+            'page': page,
+            'from': from_param,
+            'to': to_param,
+            'searchIn': 'title,description',
+            'apiKey': newsapi['api_key']
+        }
+
+        try:
+            response = requests.get(url, params=params, timeout=NEWS_REQUEST_TIMEOUT_SECONDS)
+            news = response.json()
+            if response.status_code != 200:
+                raise NewsAPIError(news.get('message', 'Unknown error'), response.status_code)
+        except (requests.RequestException, ValueError, NewsAPIError) as e:
+            # Keep earlier pages when a later one fails (e.g. the plan's result limit)
+            if page > 1:
+                logger.warning(f"NewsAPI page {page} failed after {len(articles)} articles: {str(e)}")
+                break
+            if isinstance(e, NewsAPIError):
+                raise
+            raise NewsAPIError(f"Request failed: {str(e)}", 502) from e
+
+        articles.extend(news['articles'])
+        if len(news['articles']) < NEWS_PAGE_SIZE or len(articles) >= news.get('totalResults', 0):
+            break
+    else:
+        logger.warning(f"NewsAPI paging stopped at {NEWS_MAX_PAGES} pages")
+    return articles
+
+def get_news_db() -> sqlite3.Connection:
+    """
+    Initialize and return the local news cache database
+
+    Articles are stored once per URL and linked to every symbol whose
+    query returned them, so tickers sharing a story reuse the same row.
+    The connection is lazily created and shared across invocations in
+    the same worker; callers must hold _news_db_lock while using it.
+
+    Returns:
+        sqlite3.Connection: Open connection to the news cache
+    """
+    global _news_db
+    if _news_db is None:
+        db = sqlite3.connect(NEWS_CACHE_PATH, check_same_thread=False)
+        db.executescript("""
+            CREATE TABLE IF NOT EXISTS news_articles (
+                url TEXT PRIMARY KEY,
+                published_at INTEGER NOT NULL,
+                published_at_raw TEXT NOT NULL,
+                title TEXT,
+                description TEXT,
+                source TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_news_articles_published_at
+                ON news_articles (published_at);
+            CREATE TABLE IF NOT EXISTS news_symbols (
+                symbol TEXT NOT NULL,
+                url TEXT NOT NULL,
+                PRIMARY KEY (symbol, url)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS news_fetches (
+                symbol TEXT PRIMARY KEY,
+                fetched_at INTEGER NOT NULL
+            );
+        """)
+        _news_db = db
+    return _news_db
+
+def parse_published_at(value: str) -> int:
+    """
+    Convert a NewsAPI publishedAt timestamp to epoch seconds
+
+    Uses a precompiled pattern instead of datetime.strptime, and ignores
+    any fractional seconds or offset suffix (NewsAPI timestamps are UTC).
+
+    Args:
+        value (str): Timestamp such as '2024-01-31T14:05:00Z'
+
+    Returns:
+        int: Seconds since the Unix epoch
+
+    Raises:
+        ValueError: If the timestamp is not in the expected format
+    """
+    match = _PUBLISHED_AT_RE.match(value)
+    if not match:
+        raise ValueError(f"Invalid publishedAt timestamp: {value}")
+    return calendar.timegm(tuple(map(int, match.groups())))
+
+def get_news_fetch_state(symbol: str):
+    """
+    Look up when news was last fetched for a symbol
+
+    Args:
+        symbol (str): Stock ticker symbol
+
+    Returns:
+        tuple: (fetched_at, last_published) in epoch seconds, either may be None
+    """
+    with _news_db_lock:
+        db = get_news_db()
+        row = db.execute(
+            "SELECT fetched_at FROM news_fetches WHERE symbol = ?", (symbol,)
+        ).fetchone()
+        last = db.execute(
+            """SELECT MAX(a.published_at) FROM news_articles a
+               JOIN news_symbols s ON s.url = a.url WHERE s.symbol = ?""",
+            (symbol,)
+        ).fetchone()
+    return (row[0] if row else None), last[0]
+
+def store_news_articles(symbol: str, articles: list, fetched_at: int):
+    """
+    Save NewsAPI articles for a symbol and drop anything outside the window
+
+    Articles are de-duplicated by URL. The symbol's fetch time is recorded
+    so later requests can be served from the cache until the TTL expires.
+
+    Args:
+        symbol (str): Stock ticker symbol
+        articles (list): Raw article objects from the NewsAPI response
+        fetched_at (int): Fetch time in epoch seconds
+    """
+    rows = []
+    for article in articles:
+        try:
+            published_at = parse_published_at(article['publishedAt'])
+        except (KeyError, TypeError, ValueError):
+            logger.warning(f"Skipping article with invalid date: {article.get('url')}")
+            continue
+        rows.append((
+            article['url'],
+            published_at,
+            article['publishedAt'],
+            article['title'],
+            article.get('description', ''),
+            article['source']['name']
+        ))
+
+    cutoff = fetched_at - NEWS_WINDOW_DAYS * 86400
+    with _news_db_lock:
+        db = get_news_db()
+        with db:
+            db.executemany(
+                "INSERT OR IGNORE INTO news_articles VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+            db.executemany(
+                "INSERT OR IGNORE INTO news_symbols VALUES (?, ?)",
+                [(symbol, row[0]) for row in rows]
+            )
+            db.execute(
+                "INSERT OR REPLACE INTO news_fetches VALUES (?, ?)", (symbol, fetched_at)
+            )
+            db.execute("DELETE FROM news_articles WHERE published_at < ?", (cutoff,))
+            db.execute(
+                "DELETE FROM news_symbols WHERE url NOT IN (SELECT url FROM news_articles)"
+            )
+
+def record_news_refresh_failure(symbol: str, now_ts: int, ttl: int):
+    """
+    Delay the next refresh attempt for a symbol after a failed refresh
+    
+    The fetch time is moved so the entry expires again after
+    NEWS_RETRY_SECONDS (or the TTL, if shorter), which stops every
+    request from calling NewsAPI while it is down or rate-limited.
+    A newer successful fetch time is never overwritten.
+    
+    Args:
+        symbol (str): Stock ticker symbol
+        now_ts (int): Current time in epoch seconds
+        ttl (int): Cache TTL in seconds
+    """
+    retry_fetched_at = now_ts - ttl + min(NEWS_RETRY_SECONDS, ttl)
+    try:
+        with _news_db_lock:
+            db = get_news_db()
+            with db:
+                db.execute(
+                    """INSERT INTO news_fetches VALUES (?, ?)
+                       ON CONFLICT (symbol) DO UPDATE
+                       SET fetched_at = MAX(fetched_at, excluded.fetched_at)""",
+                    (symbol, retry_fetched_at)
+                )
+    except sqlite3.Error as e:
+        logger.warning(f"Could not record news refresh failure for {symbol}: {str(e)}")
+
+def get_cached_news(symbol: str, since: int, limit: int = 10) -> list:
+    """
+    Retrieve cached articles for a symbol, newest first
+
+    Args:
+        symbol (str): Stock ticker symbol
+        since (int): Oldest publish time to include, in epoch seconds
+        limit (int, optional): Maximum number of articles. Defaults to 10.
+
+    Returns:
+        list: Articles with title, description, url, publishedAt and source
+    """
+    with _news_db_lock:
+        rows = get_news_db().execute(
+            """SELECT a.title, a.description, a.url, a.published_at_raw, a.source
+               FROM news_articles a JOIN news_symbols s ON s.url = a.url
+               WHERE s.symbol = ? AND a.published_at >= ?
+               ORDER BY a.published_at DESC LIMIT ?""",
+            (symbol, since, limit)
+        ).fetchall()
+    return [
+        {
+            'title': title,
+            'description': description,
+            'url': url,
+            'publishedAt': published_at,
+            'source': source
+        }
+        for title, description, url, published_at, source in rows
+    ]
+
 def add_cors_headers(resp: func.HttpResponse) -> func.HttpResponse:
     """
     Add CORS headers to enable cross-origin requests
@@ -129,7 +439,11 @@ def get_stock_history(symbol: str, period: str = "1mo"):
     Retrieve historical stock price data for charting
     
     Fetches OHLC (Open, High, Low, Close) data for the specified
-    time period to enable price chart visualization.
+    time period to enable price chart visualization. Data is returned
+    as NumPy columns rather than per-row dicts so large periods can be
+    serialized without materializing every row as Python objects.
+    Prices are rounded to cents and kept as float32 when that
+    precision is sufficient.
     
     Args:
         symbol (str): Stock ticker symbol
@@ -137,7 +451,7 @@ def get_stock_history(symbol: str, period: str = "1mo"):
                                Options include: 1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max
     
     Returns:
-        list: Time series of historical price data points with OHLC values
+        dict: Columns date (datetime64[D]), open, high, low, close and volume (uint64)
     
     Raises:
         Exception: If historical data couldn't be retrieved
@@ -148,23 +462,130 @@ def get_stock_history(symbol: str, period: str = "1mo"):
         
         if history.empty:
             raise Exception("No historical data found")
-            
-        result = []
-        for index, row in history.iterrows():
-            result.append({
-                "date": index.strftime("%Y-%m-%d"),
-                "open": round(float(row["Open"]), 2),
-                "high": round(float(row["High"]), 2),
-                "low": round(float(row["Low"]), 2),
-                "close": round(float(row["Close"]), 2),
-                "volume": int(row["Volume"])
-            })
-            
-        return result
+
+        # yfinance can return NaN prices or volume on some rows; the
+        # serializers have no representation for them, so skip those rows
+        complete = history.dropna(subset=["Open", "High", "Low", "Close", "Volume"])
+        if len(complete) < len(history):
+            logger.warning(f"Dropped {len(history) - len(complete)} incomplete history rows for {symbol}")
+            history = complete
+        if history.empty:
+            raise Exception("No historical data found")
+        if (history["Volume"] < 0).any():
+            raise Exception("Invalid negative volume in historical data")
+
+        index = history.index
+        if index.tz is not None:
+            index = index.tz_localize(None)
+
+        columns = {
+            "date": index.values.astype("datetime64[D]"),
+            "volume": history["Volume"].to_numpy(dtype=np.uint64)
+        }
+        for name in ("Open", "High", "Low", "Close"):
+            values = history[name].to_numpy(dtype=np.float64).round(2)
+            # float32 keeps cent precision only below FLOAT32_PRICE_LIMIT
+            if np.nanmax(np.abs(values)) < FLOAT32_PRICE_LIMIT:
+                values = values.astype(np.float32)
+            columns[name.lower()] = values
+
+        return columns
     except Exception as e:
         logger.error(f"Error fetching stock history: {str(e)}")
         raise
 
+def iter_history_chunks(symbol: str, columns: dict, fmt: str = "json"):
+    """
+    Serialize historical price columns chunk by chunk
+    
+    Rows are formatted straight from the NumPy arrays in slices of
+    HISTORY_CHUNK_ROWS, so no per-row dicts or full intermediate
+    string are built before encoding.
+    
+    Args:
+        symbol (str): Stock ticker symbol, included in the JSON envelope
+        columns (dict): Columns as returned by get_stock_history
+        fmt (str, optional): A key of HISTORY_ROW_TEMPLATES. Defaults to "json".
+    
+    Yields:
+        bytes: UTF-8 encoded pieces of the response body
+    """
+    template, separator = HISTORY_ROW_TEMPLATES[fmt]
+    if fmt == "json":
+        yield f'{{"symbol": {json.dumps(symbol)}, "history": ['.encode()
+    elif fmt == "csv":
+        yield b"date,open,high,low,close,volume\n"
+
+    total = len(columns["date"])
+    for start in range(0, total, HISTORY_CHUNK_ROWS):
+        stop = start + HISTORY_CHUNK_ROWS
+        rows = zip(
+            np.datetime_as_string(columns["date"][start:stop], unit="D").tolist(),
+            columns["open"][start:stop].tolist(),
+            columns["high"][start:stop].tolist(),
+            columns["low"][start:stop].tolist(),
+            columns["close"][start:stop].tolist(),
+            columns["volume"][start:stop].tolist()
+        )
+        chunk = separator.join([template % row for row in rows])
+        if fmt == "json":
+            if start:
+                chunk = separator + chunk
+        else:
+            chunk += separator
+        yield chunk.encode()
+
+    if fmt == "json":
+        yield b"]}"
+
+def pack_history(columns: dict) -> bytes:
+    """
+    Encode historical price columns in the packed binary layout
+    
+    All values are little-endian. A 16-byte header (magic 'STKH',
+    uint32 version, uint32 row count, uint32 flags) is followed by
+    one contiguous buffer per column, in this order:
+    
+        volume  uint64[count]
+        open    float32[count] or float64[count]
+        high    float32[count] or float64[count]
+        low     float32[count] or float64[count]
+        close   float32[count] or float64[count]
+        date    int32[count]    days since 1970-01-01
+    
+    Prices are float64 when flag HISTORY_PACKED_FLAG_FLOAT64 is set,
+    which happens whenever get_stock_history kept any price column as
+    float64 to preserve cent precision. The 8-byte columns come first
+    so every column stays aligned for typed array views.
+    
+    Columns already in the target dtype are passed through as views of
+    the NumPy buffers, so the only copy is into the response body.
+    
+    The frontend's decodePackedHistory only accepts
+    HISTORY_PACKED_VERSION, and the home page always requests this
+    format. Changing the layout or version therefore requires deploying
+    the backend and frontend together.
+    
+    Args:
+        columns (dict): Columns as returned by get_stock_history
+    
+    Returns:
+        bytes: Packed response body
+    """
+    count = len(columns["date"])
+    prices = [columns[name] for name in ("open", "high", "low", "close")]
+    use_float64 = any(values.dtype == np.float64 for values in prices)
+    flags = HISTORY_PACKED_FLAG_FLOAT64 if use_float64 else 0
+    price_dtype = "<f8" if use_float64 else "<f4"
+
+    buffers = [
+        HISTORY_PACKED_HEADER.pack(HISTORY_PACKED_MAGIC, HISTORY_PACKED_VERSION, count, flags),
+        columns["volume"].astype("<u8", copy=False)
+    ]
+    buffers.extend(values.astype(price_dtype, copy=False) for values in prices)
+    buffers.append(columns["date"].view("<i8").astype("<i4"))
+    return b"".join(memoryview(buffer) for buffer in buffers)
+
 @app.route(route="GetStockData", auth_level=func.AuthLevel.ANONYMOUS)
 def GetStockData(req: func.HttpRequest) -> func.HttpResponse:
     """
@@ -221,13 +642,16 @@ def GetStockHistory(req: func.HttpRequest) -> func.HttpResponse:
         symbol (str): Stock ticker symbol (required)
         period (str): Time period for historical data (default: '1y')
                      Options: 1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max
+        format (str): Response format (default: 'json')
+                     Options: json, ndjson, csv, packed (see pack_history)
     
     Returns:
-        HTTP Response with JSON payload containing historical price data
+        HTTP Response with historical price data in the requested format
     """
     try:
         symbol = req.params.get('symbol')
         period = req.params.get('period', '1y')
+        fmt = req.params.get('format', 'json').lower()
 
         if not symbol:
             return add_cors_headers(func.HttpResponse(
@@ -236,10 +660,22 @@ def GetStockHistory(req: func.HttpRequest) -> func.HttpResponse:
                 mimetype="application/json"
             ))
 
-        history = get_stock_history(symbol, period)
+        if fmt not in HISTORY_MIMETYPES:
+            return add_cors_headers(func.HttpResponse(
+                json.dumps({"error": f"Unsupported format. Options: {', '.join(HISTORY_MIMETYPES)}"}),
+                status_code=400,
+                mimetype="application/json"
+            ))
+
+        columns = get_stock_history(symbol, period)
+        if fmt == 'packed':
+            body = pack_history(columns)
+        else:
+            # The worker needs the complete body, so the encoded chunks are joined here
+            body = b"".join(iter_history_chunks(symbol, columns, fmt))
         return add_cors_headers(func.HttpResponse(
-            json.dumps({"symbol": symbol, "history": history}),
-            mimetype="application/json"
+            body,
+            mimetype=HISTORY_MIMETYPES[fmt]
         ))
     except Exception as e:
         error_msg = str(e)
@@ -270,8 +706,8 @@ def GetSentimentAnalysis(req: func.HttpRequest) -> func.HttpResponse:
         company_name = info.get('longName', '')
 
         # Calculate dates for the last 2 weeks
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=14)
+        end_date = datetime.now(tz=timezone.utc)
+        start_date = end_date - timedelta(days=NEWS_WINDOW_DAYS)
 
         # Get historical data for technical analysis
         history = stock.history(period="1y")  # Changed to 1y to ensure enough data for 200-day MA
@@ -339,54 +775,49 @@ def GetSentimentAnalysis(req: func.HttpRequest) -> func.HttpResponse:
             if any(value != 'N/A' for value in metrics.values())
         }
 
-        newsapi = get_newsapi()
-        url = f"{newsapi['base_url']}/everything"
-        params = {
-            'q': f'({symbol} OR "{company_name}") AND (stock OR market OR trading OR earnings OR investment)',
-            'language': 'en',
-            'sortBy': 'relevancy',
-            'pageSize': 10,
-            'from': start_date.strftime('%Y-%m-%d'),
-            'to': end_date.strftime('%Y-%m-%d'),
-            'searchIn': 'title,description',
-            'apiKey': newsapi['api_key']
-        }
-        
-        response = requests.get(url, params=params)
-        news = response.json()
-
-        if response.status_code != 200:
-            return add_cors_headers(func.HttpResponse(
-                json.dumps({
-                    "symbol": symbol,
-                    "error": f"NewsAPI error: {news.get('message', 'Unknown error')}",
-                    "status": response.status_code
-                }),
-                status_code=response.status_code,
-                mimetype="application/json"
-            ))
-
-        articles = []
+        # Refresh the news cache only when this symbol's entry has expired.
+        # A symbol without a fetch record gets the full window; otherwise
+        # only articles newer than the last cached one are requested
+        cache_key = symbol.upper()
+        now_ts = int(end_date.timestamp())
+        window_start_ts = int(start_date.timestamp())
+        fetched_at, last_published = get_news_fetch_state(cache_key)
+        ttl = get_news_cache_ttl()
+        if fetched_at is None or now_ts - fetched_at >= ttl:
+            if fetched_at is not None and last_published is not None and last_published > window_start_ts:
+                from_param = datetime.fromtimestamp(last_published, tz=timezone.utc).strftime('%Y-%m-%dT%H:%M:%S')
+            else:
+                from_param = start_date.strftime('%Y-%m-%dT%H:%M:%S')
+
+            try:
+                fetched = fetch_news_articles(
+                    f'({symbol} OR "{company_name}") AND (stock OR market OR trading OR earnings OR investment)',
+                    from_param,
+                    end_date.strftime('%Y-%m-%dT%H:%M:%S')
+                )
+                store_news_articles(cache_key, fetched, now_ts)
+            except (NewsAPIError, sqlite3.Error) as e:
+                # Fall back to the cached window rather than failing the request,
+                # and back off so NewsAPI isn't retried on every request
+                logger.warning(f"News refresh failed for {cache_key}: {str(e)}")
+                record_news_refresh_failure(cache_key, now_ts, ttl)
+                if not get_cached_news(cache_key, window_start_ts):
+                    status_code = e.status_code if isinstance(e, NewsAPIError) else 500
+                    return add_cors_headers(func.HttpResponse(
+                        json.dumps({
+                            "symbol": symbol,
+                            "error": f"NewsAPI error: {str(e)}" if isinstance(e, NewsAPIError) else f"News cache error: {str(e)}",
+                            "status": status_code
+                        }),
+                        status_code=status_code,
+                        mimetype="application/json"
+                    ))
+
+        # Serve the newest articles of the 2-week window from the cache
+        articles = get_cached_news(cache_key, window_start_ts)
         news_context = f"Company: {company_name} ({symbol})\n\n"
-        
-        # Process and sort articles by date
-        processed_articles = []
-        for article in news['articles']:
-            article_date = datetime.strptime(article['publishedAt'], "%Y-%m-%dT%H:%M:%SZ")
-            processed_articles.append((article_date, article))
-        
-        # Sort by date, newest first
-        processed_articles.sort(key=lambda x: x[0], reverse=True)
-        
-        for _, article in processed_articles:
-            articles.append({
-                'title': article['title'],
-                'description': article.get('description', ''),
-                'url': article['url'],
-                'publishedAt': article['publishedAt'],
-                'source': article['source']['name']
-            })
-            news_context += f"\nSource: {article['source']['name']}\nDate: {article['publishedAt']}\nTitle: {article['title']}\nDescription: {article.get('description', '')}\n"
+        for article in articles:
+            news_context += f"\nSource: {article['source']}\nDate: {article['publishedAt']}\nTitle: {article['title']}\nDescription: {article['description']}\n"
 
         # Format market metrics for AI context
         metrics_context = "\nMarket Metrics:\n"
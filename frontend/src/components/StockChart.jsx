@@ -23,6 +23,9 @@ ChartJS.register(
   Legend
 );
 
+// Packed history dates are day offsets from the Unix epoch
+const MS_PER_DAY = 24 * 60 * 60 * 1000;
+
 const StockChart = ({ data, stockName }) => {
   if (!data || data.length === 0) return null;
 
@@ -76,7 +79,7 @@ const StockChart = ({ data, stockName }) => {
         displayColors: false,
         callbacks: {
           title: (tooltipItems) => {
-            const date = new Date(data[tooltipItems[0].dataIndex].date);
+            const date = new Date(data.dates[tooltipItems[0].dataIndex] * MS_PER_DAY);
             return date.toLocaleDateString(undefined, { 
               weekday: 'short', 
               year: 'numeric', 
@@ -177,8 +180,8 @@ const StockChart = ({ data, stockName }) => {
   };
 
   const chartData = {
-    labels: data.map(item => {
-      const date = new Date(item.date);
+    labels: Array.from(data.dates, days => {
+      const date = new Date(days * MS_PER_DAY);
       const today = new Date();
       const isToday = date.toDateString() === today.toDateString();
       
@@ -195,7 +198,7 @@ const StockChart = ({ data, stockName }) => {
     datasets: [
       {
         label: 'Price',
-        data: data.map(item => item.close),
+        data: Array.from(data.close),
         borderColor: '#1976d2',
         backgroundColor: '#1976d2',
         pointBackgroundColor: '#1976d2',
@@ -36,17 +36,15 @@ const formatDividendYield = (value) => {
 
 /**
  * Calculates 52-week high and low from historical data
- * @param {Array} historicalData - Array of historical price data points
+ * @param {Object} historicalData - Historical price columns (see decodePackedHistory)
  * @returns {Object} Object containing low and high price for the last year
  */
 const calculate52WeekRange = (historicalData) => {
   if (!historicalData || historicalData.length === 0) return { low: null, high: null };
   
   // Get data for the last 52 weeks (approximately 252 trading days)
-  const yearData = historicalData.slice(-252);
-  
-  const low = Math.min(...yearData.map(item => item.low));
-  const high = Math.max(...yearData.map(item => item.high));
+  const low = Math.min(...historicalData.low.subarray(-252));
+  const high = Math.max(...historicalData.high.subarray(-252));
   
   return { low, high };
 };
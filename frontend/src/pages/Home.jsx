@@ -16,7 +16,7 @@ import TrendingUpIcon from '@mui/icons-material/TrendingUp';
 import InfoIcon from '@mui/icons-material/Info';
 import ShowChartIcon from '@mui/icons-material/ShowChart';
 import SearchIcon from '@mui/icons-material/Search';
-import { getStockInfo, getHistoricalData, getStockSentiment } from '../services/api';
+import { getStockInfo, getPackedHistoricalData, getStockSentiment } from '../services/api';
 
 /**
  * Global styles for search-related UI elements
@@ -61,7 +61,7 @@ const GlobalStyles = () => {
 const Home = () => {
   // State for stock data
   const [stockInfo, setStockInfo] = useState(null);
-  const [historicalData, setHistoricalData] = useState([]);
+  const [historicalData, setHistoricalData] = useState(null);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState(null);
   
@@ -102,28 +102,23 @@ const Home = () => {
     // Clear all analyses when a new stock is selected
     clearAnalyses();
     setStockInfo(null); // Clear current stock info
-    setHistoricalData([]); // Clear historical data
+    setHistoricalData(null); // Clear historical data
 
     try {
       // Fetch stock info and historical data in parallel
-      const [info, historyResponse] = await Promise.all([
+      const [info, history] = await Promise.all([
         getStockInfo(symbol),
-        getHistoricalData(symbol)
+        getPackedHistoricalData(symbol)
       ]);
       setStockInfo(info);
-      // Check if history data exists and has the expected format
-      if (historyResponse && historyResponse.history && Array.isArray(historyResponse.history)) {
-        setHistoricalData(historyResponse.history);
-      } else {
-        setHistoricalData([]);
-      }
+      setHistoricalData(history);
       
       // Set flag to trigger scrolling after rendering is complete
       setShouldScrollToInfo(true);
     } catch (err) {
       setError('Error fetching stock data. Please try again.');
       console.error('Error:', err);
-      setHistoricalData([]);
+      setHistoricalData(null);
     } finally {
       setLoading(false);
     }
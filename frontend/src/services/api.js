@@ -3,6 +3,12 @@ import axios from 'axios';
 // Get the base URL from environment variables or use a default
 const BASE_URL = import.meta.env.VITE_API_URL || 'http://localhost:7071/api';
 
+// Packed history layout, see pack_history in the backend
+const PACKED_HISTORY_MAGIC = 'STKH';
+const PACKED_HISTORY_VERSION = 2;
+const PACKED_HISTORY_HEADER_BYTES = 16;
+const PACKED_HISTORY_FLAG_FLOAT64 = 0x1;
+
 /**
  * Centralized API client for all backend communications
  * Preconfigured with base URL and common headers
@@ -40,17 +46,52 @@ export const getStockInfo = async (symbol) => {
 };
 
 /**
- * Fetches historical price data for charting
+ * Decodes a packed history response into typed arrays without copying
+ * Typed array views use platform byte order, which is little-endian in all supported browsers
+ * 
+ * @param {ArrayBuffer} buffer - Response body from GetStockHistory with format 'packed'
+ * @returns {Object} - Columns: dates (days since 1970-01-01), open, high, low, close, volume, plus length
+ */
+export const decodePackedHistory = (buffer) => {
+  const view = new DataView(buffer);
+  const magic = String.fromCharCode(...new Uint8Array(buffer, 0, 4));
+  if (magic !== PACKED_HISTORY_MAGIC || view.getUint32(4, true) !== PACKED_HISTORY_VERSION) {
+    throw new Error('Unsupported packed history format');
+  }
+
+  const length = view.getUint32(8, true);
+  // High-priced symbols are sent as float64 to keep cent precision
+  const PriceArray = view.getUint32(12, true) & PACKED_HISTORY_FLAG_FLOAT64 ? Float64Array : Float32Array;
+  let offset = PACKED_HISTORY_HEADER_BYTES;
+  const column = (ArrayType) => {
+    const values = new ArrayType(buffer, offset, length);
+    offset += values.byteLength;
+    return values;
+  };
+
+  // Column order must match the backend layout
+  const volume = column(BigUint64Array);
+  const open = column(PriceArray);
+  const high = column(PriceArray);
+  const low = column(PriceArray);
+  const close = column(PriceArray);
+  const dates = column(Int32Array);
+  return { length, dates, open, high, low, close, volume };
+};
+
+/**
+ * Fetches historical price data in the compact binary format
  * 
  * @param {string} symbol - Stock ticker symbol
  * @param {string} period - Time period for historical data (default: '1y')
- * @returns {Promise<Object>} - Historical price data with OHLC values
+ * @returns {Promise<Object>} - Decoded price columns (see decodePackedHistory)
  */
-export const getHistoricalData = async (symbol, period = '1y') => {
+export const getPackedHistoricalData = async (symbol, period = '1y') => {
   const response = await api.get(`/GetStockHistory`, {
-    params: { symbol, period }
+    params: { symbol, period, format: 'packed' },
+    responseType: 'arraybuffer'
   });
-  return response.data;
+  return decodePackedHistory(response.data);
 };
 
 /**